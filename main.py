@@ -1,7 +1,7 @@
 # main.py
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, Field, field_validator  # Use @validator for Pydantic 1.x
 from fastapi.exceptions import RequestValidationError
@@ -68,6 +68,16 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         content={"error": error_messages},
     )
 
+# Registered before the GET route so HEAD requests match here instead of
+# falling through to Starlette's auto-added HEAD handling on the GET route,
+# which would still render the template just to discard the body.
+@app.head("/")
+async def read_root_head():
+    """
+    Serve the homepage headers without rendering the template.
+    """
+    return Response(media_type="text/html")
+
 @app.get("/")
 async def read_root(request: Request):
     """
@@ -6,6 +6,7 @@ This module contains pytest fixtures for End-to-End (E2E) testing of the FastAPI
 calculator application using Playwright for browser automation.
 
 Fixtures provided:
+- client: Session-scoped TestClient for integration tests against the FastAPI app
 - fastapi_server: Starts and manages the FastAPI server for E2E tests
 - playwright_instance_fixture: Manages Playwright's lifecycle
 - browser: Provides a Chromium browser instance for tests
@@ -21,11 +22,39 @@ These fixtures enable automated browser testing by:
 
 import subprocess
 import time
+import httpx
 import pytest
+import pytest_asyncio
 from playwright.sync_api import sync_playwright
 import requests
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """
+    Session-scoped fixture to create an async client for the FastAPI application.
+
+    This fixture initializes a single httpx.AsyncClient wired directly to the
+    app via ASGITransport, shared by every test in the session. Unlike
+    TestClient, there is no sync-to-async portal thread: each request is awaited
+    on the already-running event loop, so no thread hand-off happens per call.
+    The calculator endpoints are stateless and the mocked-exception tests
+    restore their patches automatically, so sharing one client is safe.
+
+    Benefits:
+    - Speeds up testing by avoiding the overhead of running a server.
+    - Avoids repeating client setup/teardown for every test function.
+    - Skips TestClient's portal-thread bridge on every request.
+    """
+    # Import lazily so collection-only runs (e.g. 'pytest -k' with no match,
+    # '--collect-only') never pay for FastAPI route registration, pydantic
+    # schema building, or Jinja2 environment construction
+    from main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        yield client  # Provide the async client instance to the test functions
+
 
 @pytest.fixture(scope='session')
 def fastapi_server():
@@ -0,0 +1,31 @@
+# tests/perf/conftest.py
+
+"""
+Module: conftest.py
+
+Fixtures for the endpoint benchmark suite.
+
+pytest-benchmark drives its timed rounds synchronously, so this package
+shadows the session-wide async client with a synchronous TestClient whose
+requests can be invoked directly from the benchmark loop.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    Session-scoped fixture to create a synchronous TestClient for benchmarking.
+
+    The integration suite uses an async client, but pytest-benchmark calls the
+    benchmarked function from plain synchronous code, so the perf tests get
+    their own TestClient here. One instance is shared across the session so
+    client construction does not pollute the measurements.
+    """
+    # Import lazily so app construction only happens when a perf test runs
+    from main import app
+
+    with TestClient(app) as client:
+        yield client  # Provide the TestClient instance to the benchmark tests
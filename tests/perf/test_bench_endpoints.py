@@ -0,0 +1,64 @@
+# tests/perf/test_bench_endpoints.py
+
+"""
+Benchmark Tests for FastAPI Calculator Endpoints
+
+This module measures latency and throughput of the `/add`, `/subtract`,
+`/multiply`, and `/divide` endpoints with pytest-benchmark. The rest of the
+suite only asserts correctness; these benchmarks provide the measured baseline
+that any future performance change can be validated against.
+
+pytest-benchmark disables itself automatically while pytest-xdist is active
+(the default configuration runs the suite with '-n auto'), in which case each
+benchmark body still executes once as a plain smoke test. To collect real
+measurements, run the perf suite serially with benchmarking forced on:
+
+    pytest tests/perf -n0 --dist=no --benchmark-enable
+"""
+
+import pytest  # Import the pytest framework for writing and running tests
+
+# ---------------------------------------------
+# Pre-serialized request bodies
+# ---------------------------------------------
+# Encoded once at import time so JSON serialization stays out of the timed loop.
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_BODY_10_5 = b'{"a": 10, "b": 5}'
+_BODY_10_2 = b'{"a": 10, "b": 2}'
+
+# ---------------------------------------------
+# Benchmark Function: test_bench_endpoint
+# ---------------------------------------------
+
+@pytest.mark.benchmark(group="endpoints")
+@pytest.mark.parametrize(
+    "endpoint, body",
+    [
+        ("/add", _BODY_10_5),
+        ("/subtract", _BODY_10_5),
+        ("/multiply", _BODY_10_5),
+        ("/divide", _BODY_10_2),
+    ],
+    ids=["add", "sub", "mul", "div"],
+)
+def test_bench_endpoint(client, benchmark, endpoint, body):
+    """
+    Benchmark one POST round-trip through each calculator endpoint.
+
+    Steps:
+    1. Run `client.post(...)` under pytest-benchmark's timing loop.
+    2. Assert the final response still returns `200 OK` (keeps the benchmark
+       honest — a fast error path would otherwise score well).
+    3. Record throughput (ops/s) in the benchmark's extra_info for reports.
+    """
+    # Run the request under the benchmark timer
+    response = benchmark(lambda: client.post(endpoint, content=body, headers=_JSON_HEADERS))
+
+    # Assert that the benchmarked call still succeeds
+    assert response.status_code == 200
+
+    # Record throughput alongside the latency stats (stats is None when
+    # benchmarking is disabled, e.g. under xdist)
+    if benchmark.stats is not None:
+        benchmark.extra_info["throughput_ops_per_sec"] = 1 / benchmark.stats.stats.mean
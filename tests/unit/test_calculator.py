@@ -20,122 +20,122 @@ Test Coverage:
     - Error conditions (division by zero)
 
 """
-@pytest.mark.parametrize(
-    "a, b, expected",
-    [
-        (5, 3, 8),           # Test adding two positive integers
-        (0, 0, 0),           # Test adding two zeros
-        (-5, 3, -2),         # Test adding a negative and a positive integer
-        (-5, -3, -8),        # Test adding negative integers
-        (2.5, 3.5, 6.0),     # Test adding two positive floats
-        (-2.5, 3.5, 1.0),    # Test adding a negative float and a positive float
-    ],
-    ids=[
-        "add_two_positive_integers",
-        "add_two_zeros",
-        "add_negative_and_positive_integer",
-        "add_two_negative_integers",
-        "add_two_positive_floats",
-        "add_negative_float_and_positive_float",
-    ]
-)
-def test_addition(a: Num, b: Num, expected: Num, caplog) -> None:
-    with caplog.at_level(logging.INFO):
-        result = add(a, b)
-    
-        assert result == expected, f"Expected addition({a}, {b}) to be {expected}, but got {result}"
-        assert any("Add result" in record.message for record in caplog.records)
+
 # ---------------------------------------------
-# Unit Tests for the 'subtraction' Method
+# Parametrize Data
 # ---------------------------------------------
+# The case tables and id lists are built once at module level as tuples, so
+# repeated re-collection (e.g. 'pytest --lf' or watch-mode reruns) does not
+# re-materialize the list literals inside each decorator.
 
-@pytest.mark.parametrize(
-    "a, b, expected",
-    [
-        (5, 3, 2),           # Test subtracting two positive integers
-        (3, 5,-2),           # Test subtracting a smaller positive integer from a larger one
-        (0, 0, 0),           # Test subtracting two zeros
-        (-5, -3, -2),        # Test subtracting a negative integer from another negative integer
-        (3, -5, 8),          # Test subtracting positive integer from another negative integer
-        (10.5, 5.5, 5.0),    # Test subtracting two positive floats
-        (-10.5, -5.5, -5.0), # Test subtracting two negative floats
-    ],
-    ids=[
-        "subtract_two_positive_integers",
-        "subtract_smaller_positive_integer_from_larger",
-        "subtract_two_zeros",
-        "subtract_negative_integer_from_negative_integer",
-        "subtract_negative_integer_from_positive_integer",
-        "subtract_two_positive_floats",
-        "subtract_two_negative_floats",
-    ]
+_ADDITION_CASES = (
+    (5, 3, 8),           # Test adding two positive integers
+    (0, 0, 0),           # Test adding two zeros
+    (-5, 3, -2),         # Test adding a negative and a positive integer
+    (-5, -3, -8),        # Test adding negative integers
+    (2.5, 3.5, 6.0),     # Test adding two positive floats
+    (-2.5, 3.5, 1.0),    # Test adding a negative float and a positive float
 )
-def test_subtraction(a: Num, b: Num, expected: Num, caplog) -> None:
-    with caplog.at_level(logging.DEBUG):
-        result = subtract(a, b)
-        assert result == expected, f"Expected subtraction({a}, {b}) to be {expected}, but got {result}"
-
-@pytest.mark.parametrize(
-    "a, b, expected",
-    [
-        (2, 3, 6),           # Test multiplying two positive integers
-        (-2, 3, -6),         # Test multiplying a positive and negative integers
-        (0, 10, 0),          # Test multiplying zero with a positive integer
-        (-2, -3, 6),         # Test multiplying two negative integers
-        (2.5, 4.0, 10.0),    # Test multiplying two positive floats
-        (-2.5, 4.0, -10.0),  # Test multiplying a negative float with a positive float
-    ],
-    ids=[
-        "multiply_two_positive_integers",
-        "multiply_positive_and_negative_integers",
-        "multiply_zero_with_positive_integer",
-        "multiply_two_negative_integers",
-        "multiply_two_positive_floats",
-        "multiply_negative_float_with_positive_float",
-    ]
+_ADDITION_IDS = (
+    "add_two_positive_integers",
+    "add_two_zeros",
+    "add_negative_and_positive_integer",
+    "add_two_negative_integers",
+    "add_two_positive_floats",
+    "add_negative_float_and_positive_float",
 )
-def test_multiplication(a: Num, b: Num, expected: Num, caplog) -> None:
-    with caplog.at_level(logging.DEBUG):
-        result = multiply(a, b)
-        assert result == expected, f"Expected multiplication({a}, {b}) to be {expected}, but got {result}"
-
-@pytest.mark.parametrize(
-    "a, b, expected",
-    [
-        (6, 3, 2.0),           # Test dividing two positive integers
-        (-6, -3, 2.0),         # Test dividing two negative integers
-        (6.0, 3.0, 2.0),       # Test dividing two positive floats
-        (-6.0, 3.0, -2.0),     # Test dividing a negative float by a positive float
-        (0, 5, 0.0),            # Test dividing zero by a positive integer
-    ],
-    ids=[
-        "divide_two_positive_integers",
-        "divide_two_negative_integers",
-        "divide_two_positive_floats",
-        "divide_negative_float_by_positive_float",
-        "divide_zero_by_positive_integer",
-    ]
+
+_SUBTRACTION_CASES = (
+    (5, 3, 2),           # Test subtracting two positive integers
+    (3, 5,-2),           # Test subtracting a smaller positive integer from a larger one
+    (0, 0, 0),           # Test subtracting two zeros
+    (-5, -3, -2),        # Test subtracting a negative integer from another negative integer
+    (3, -5, 8),          # Test subtracting positive integer from another negative integer
+    (10.5, 5.5, 5.0),    # Test subtracting two positive floats
+    (-10.5, -5.5, -5.0), # Test subtracting two negative floats
 )
-def test_division(a: Num, b: Num, expected: float, caplog) -> None:
-    with caplog.at_level(logging.DEBUG):
-        result = divide(a, b)
-    
-        assert result == expected, f"Expected division({a}, {b}) to be {expected}, but got {result}"
-
-
-@pytest.mark.parametrize(
-    "a, b",
-    [
-        (1, 0),    # Test dividing by zero with positive dividend
-        (-1, 0),   # Test dividing by zero with negative dividend
-        (0, 0),    # Test dividing zero by zero
-    ],
-    ids=[
-        "divide_positive_dividend_by_zero",
-        "divide_negative_dividend_by_zero",
-        "divide_zero_by_zero",
-    ]
+_SUBTRACTION_IDS = (
+    "subtract_two_positive_integers",
+    "subtract_smaller_positive_integer_from_larger",
+    "subtract_two_zeros",
+    "subtract_negative_integer_from_negative_integer",
+    "subtract_negative_integer_from_positive_integer",
+    "subtract_two_positive_floats",
+    "subtract_two_negative_floats",
+)
+
+_MULTIPLICATION_CASES = (
+    (2, 3, 6),           # Test multiplying two positive integers
+    (-2, 3, -6),         # Test multiplying a positive and negative integers
+    (0, 10, 0),          # Test multiplying zero with a positive integer
+    (-2, -3, 6),         # Test multiplying two negative integers
+    (2.5, 4.0, 10.0),    # Test multiplying two positive floats
+    (-2.5, 4.0, -10.0),  # Test multiplying a negative float with a positive float
+)
+_MULTIPLICATION_IDS = (
+    "multiply_two_positive_integers",
+    "multiply_positive_and_negative_integers",
+    "multiply_zero_with_positive_integer",
+    "multiply_two_negative_integers",
+    "multiply_two_positive_floats",
+    "multiply_negative_float_with_positive_float",
+)
+
+_DIVISION_CASES = (
+    (6, 3, 2.0),           # Test dividing two positive integers
+    (-6, -3, 2.0),         # Test dividing two negative integers
+    (6.0, 3.0, 2.0),       # Test dividing two positive floats
+    (-6.0, 3.0, -2.0),     # Test dividing a negative float by a positive float
+    (0, 5, 0.0),            # Test dividing zero by a positive integer
+)
+_DIVISION_IDS = (
+    "divide_two_positive_integers",
+    "divide_two_negative_integers",
+    "divide_two_positive_floats",
+    "divide_negative_float_by_positive_float",
+    "divide_zero_by_positive_integer",
+)
+
+# One fused table drives a single parametrized test for all four operations.
+# Each entry carries the operation under test and (for operations that log at
+# INFO) the log message the test should observe, followed by the (a, b,
+# expected) case data. Building the table from the per-operation tuples keeps
+# one parametrize decoration instead of four.
+_OPERATION_CASES = (
+    tuple((add, "Add result", *case) for case in _ADDITION_CASES)
+    + tuple((subtract, None, *case) for case in _SUBTRACTION_CASES)
+    + tuple((multiply, None, *case) for case in _MULTIPLICATION_CASES)
+    + tuple((divide, None, *case) for case in _DIVISION_CASES)
+)
+_OPERATION_IDS = _ADDITION_IDS + _SUBTRACTION_IDS + _MULTIPLICATION_IDS + _DIVISION_IDS
+
+_DIVISION_BY_ZERO_CASES = (
+    (1, 0),    # Test dividing by zero with positive dividend
+    (-1, 0),   # Test dividing by zero with negative dividend
+    (0, 0),    # Test dividing zero by zero
+)
+_DIVISION_BY_ZERO_IDS = (
+    "divide_positive_dividend_by_zero",
+    "divide_negative_dividend_by_zero",
+    "divide_zero_by_zero",
 )
+
+
+# ---------------------------------------------
+# Unit Tests for the Arithmetic Operations
+# ---------------------------------------------
+
+@pytest.mark.parametrize("operation, log_message, a, b, expected", _OPERATION_CASES, ids=_OPERATION_IDS)
+def test_operation(operation, log_message, a: Num, b: Num, expected: Num, caplog) -> None:
+    with caplog.at_level(logging.DEBUG):
+        result = operation(a, b)
+
+        assert result == expected
+        if log_message is not None:
+            assert any(log_message in record.message for record in caplog.records)
+
+
+@pytest.mark.parametrize("a, b", _DIVISION_BY_ZERO_CASES, ids=_DIVISION_BY_ZERO_IDS)
 def test_division_by_zero(a: Num, b: Num, caplog) -> None:
     with caplog.at_level(logging.DEBUG):
         with pytest.raises(ValueError, match="Cannot divide by zero!") as excinfo:
@@ -143,7 +143,6 @@ def test_division_by_zero(a: Num, b: Num, caplog) -> None:
             divide(a, b)
 
     # Assert that the exception message contains the expected error message
-        assert "Cannot divide by zero!" in str(excinfo.value), \
-            f"Expected error message 'Cannot divide by zero!', but got '{excinfo.value}'"
+        assert "Cannot divide by zero!" in str(excinfo.value)
 
         assert any("Division by zero attempted" in record.message for record in caplog.records)